@@ -21,7 +21,7 @@ N_OBS = int(os.environ.get("GAMMAPY_BENCH_N_OBS", 10))
 def data_prep():
     data_store = DataStore.from_dir("$GAMMAPY_DATA/cta-1dc/index/gps/")
     OBS_ID = 110380
-    obs_ids = OBS_ID * np.ones(N_OBS)
+    obs_ids = np.full(N_OBS, OBS_ID, dtype=np.int64)
     observations = data_store.get_observations(obs_ids)
 
     energy_axis = MapAxis.from_bounds(
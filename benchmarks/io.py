@@ -19,7 +19,7 @@ def run_benchmark():
 
     data_store = DataStore.from_dir("$GAMMAPY_DATA/cta-1dc/index/gps/")
     OBS_ID = 110380
-    obs_ids = OBS_ID * np.ones(N_OBS)
+    obs_ids = np.full(N_OBS, OBS_ID, dtype=np.int64)
     observations = data_store.get_observations(obs_ids)
 
     info["data_loading"] = time.time() - t
@@ -1,5 +1,6 @@
 import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import astropy.units as u
@@ -19,12 +20,44 @@ from gammapy.modeling.models import (PointSpatialModel, PowerLawSpectralModel,
                                      SkyModel)
 
 N_OBS = int(os.environ.get("GAMMAPY_BENCH_N_OBS", 10))
+N_JOBS = int(os.environ.get("GAMMAPY_BENCH_N_JOBS", 1))
+
+E_RECO = MapAxis.from_bounds(0.1, 40, nbin=40, interp="log", unit="TeV", name="energy")
+E_TRUE = MapAxis.from_bounds(
+    0.05, 100, nbin=200, interp="log", unit="TeV", name="energy_true"
+)
+E_FLUX = MapAxis.from_bounds(0.7, 30, nbin=11, interp="log", unit="TeV").edges
+
+# Makers that do not depend on the target or the exclusion mask
+DATASET_MAKER = SpectrumDatasetMaker(
+    containment_correction=False, selection=["counts", "exposure", "edisp"]
+)
+SAFE_MASK_MASKER = SafeMaskMaker(methods=["aeff-max"], aeff_percent=10)
+
+# Per-worker reduction state, set once per process by `init_worker`
+_WORKER = {}
+
+
+def init_worker(geom, bkg_maker):
+    _WORKER.update(geom=geom, bkg_maker=bkg_maker)
+
+
+def reduce_one(observation):
+    """Reduce a single observation to a `SpectrumDatasetOnOff`"""
+    dataset = SpectrumDatasetOnOff.create(
+        geom=_WORKER["geom"],
+        energy_axis_true=E_TRUE,
+        name=f"dataset-{observation.obs_id}",
+    )
+    dataset = DATASET_MAKER.run(dataset=dataset, observation=observation)
+    dataset_on_off = _WORKER["bkg_maker"].run(dataset, observation)
+    return SAFE_MASK_MASKER.run(dataset_on_off, observation)
 
 
 def data_prep():
     data_store = DataStore.from_dir("$GAMMAPY_DATA/hess-dl3-dr1/")
     OBS_ID = 23523
-    obs_ids = OBS_ID * np.ones(N_OBS)
+    obs_ids = np.full(N_OBS, OBS_ID, dtype=np.int64)
     observations = data_store.get_observations(obs_ids)
 
     target_position = SkyCoord(ra=83.63, dec=22.01, unit="deg", frame="icrs")
@@ -43,23 +76,11 @@ def data_prep():
 
     exclusion_mask = mask_geom.region_mask([exclusion_region], inside=False)
 
-    e_reco = MapAxis.from_bounds(
-        0.1, 40, nbin=40, interp="log", unit="TeV", name="energy"
-    )
-    e_true = MapAxis.from_bounds(
-        0.05, 100, nbin=200, interp="log", unit="TeV", name="energy_true"
-    )
-
-    geom = RegionGeom(on_region, axes=[e_reco])
+    geom = RegionGeom(on_region, axes=[E_RECO])
 
-    stacked = SpectrumDatasetOnOff.create(geom=geom, energy_axis_true=e_true, name="stacked")
-
-    dataset_maker = SpectrumDatasetMaker(
-        containment_correction=False, selection=["counts", "exposure", "edisp"]
-    )
+    stacked = SpectrumDatasetOnOff.create(geom=geom, energy_axis_true=E_TRUE, name="stacked")
 
     bkg_maker = ReflectedRegionsBackgroundMaker(exclusion_mask=exclusion_mask)
-    safe_mask_masker = SafeMaskMaker(methods=["aeff-max"], aeff_percent=10)
 
     spectral_model = PowerLawSpectralModel(
         index=2, amplitude=2e-11 * u.Unit("cm-2 s-1 TeV-1"), reference=1 * u.TeV
@@ -74,12 +95,18 @@ def data_prep():
         spatial_model=spatial_model, spectral_model=spectral_model, name=""
     )
 
-    for observation in observations:
-        dataset = stacked.copy(name=f"dataset-{observation.obs_id}")
-        dataset = dataset_maker.run(dataset=dataset, observation=observation)
-        dataset_on_off = bkg_maker.run(dataset, observation)
-        dataset_on_off = safe_mask_masker.run(dataset_on_off, observation)
-        stacked.stack(dataset_on_off)
+    initargs = (geom, bkg_maker)
+    if N_JOBS > 1:
+        # Observations are reduced in parallel, only the stacking is serial
+        with ProcessPoolExecutor(
+            max_workers=N_JOBS, initializer=init_worker, initargs=initargs
+        ) as executor:
+            for dataset_on_off in executor.map(reduce_one, observations):
+                stacked.stack(dataset_on_off)
+    else:
+        init_worker(*initargs)
+        for dataset_on_off in map(reduce_one, observations):
+            stacked.stack(dataset_on_off)
 
     stacked.models = sky_model
     return Datasets([stacked])
@@ -87,7 +114,11 @@ def data_prep():
 
 def write(stacked, filename):
     path = Path.cwd()
-    stacked.write( path / f"{filename}_datasets.yaml", filename_models= path / f"{filename}_models.yaml", overwrite=True)
+    stacked.write(
+        path / f"{filename}_datasets.yaml",
+        filename_models=path / f"{filename}_models.yaml",
+        overwrite=True,
+    )
 
 
 def read(filename):
@@ -106,8 +137,7 @@ def data_fit(stacked):
 
 
 def flux_point(stacked):
-    e_edges = MapAxis.from_bounds(0.7, 30, nbin=11, interp="log", unit="TeV").edges
-    fpe = FluxPointsEstimator(energy_edges=e_edges)
+    fpe = FluxPointsEstimator(energy_edges=E_FLUX, n_jobs=N_JOBS)
     fpe.run(datasets=stacked)
 
 
@@ -125,7 +155,8 @@ def run_benchmark():
     info["writing"] = time.time() - t
     t = time.time()
 
-    stacked = read(filename)
+    # the round-trip is only timed, the in-memory datasets are used below
+    read(filename)
     info["reading"] = time.time() - t
     t = time.time()
 
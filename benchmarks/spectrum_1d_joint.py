@@ -24,7 +24,7 @@ N_OBS = int(os.environ.get("GAMMAPY_BENCH_N_OBS", 10))
 def data_prep():
     data_store = DataStore.from_dir("$GAMMAPY_DATA/hess-dl3-dr1/")
     OBS_ID = 23523
-    obs_ids = OBS_ID * np.ones(N_OBS)
+    obs_ids = np.full(N_OBS, OBS_ID, dtype=np.int64)
     observations = data_store.get_observations(obs_ids)
     target_position = SkyCoord(ra=83.63, dec=22.01, unit="deg", frame="icrs")
     on_region_radius = Angle("0.11 deg")
@@ -51,8 +51,6 @@ def data_prep():
 
     geom = RegionGeom(on_region, axes=[e_reco])
 
-    empty = SpectrumDatasetOnOff.create(geom, energy_axis_true=e_true)
-
     dataset_maker = SpectrumDatasetMaker(
         containment_correction=True, selection=["counts", "exposure", "edisp"]
     )
@@ -76,7 +74,9 @@ def data_prep():
     datasets = []
 
     for idx, observation in enumerate(observations):
-        dataset = empty.copy(name=f"dataset{idx}")
+        dataset = SpectrumDatasetOnOff.create(
+            geom, energy_axis_true=e_true, name=f"dataset{idx}"
+        )
         dataset = dataset_maker.run(dataset=dataset, observation=observation)
         dataset_on_off = bkg_maker.run(dataset, observation)
         dataset_on_off = safe_mask_masker.run(dataset_on_off, observation)
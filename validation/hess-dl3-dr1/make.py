@@ -9,16 +9,36 @@ import yaml
 import numpy as np
 from gammapy.analysis import Analysis, AnalysisConfig
 from gammapy.modeling.models import Models
+from gammapy.utils.scripts import make_path
 
 # TODO: remove import once fit options are defined from config
 from gammapy.modeling import Fit
 
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 log = logging.getLogger(__name__)
 
 AVAILABLE_TARGETS = ["crab", "pks2155", "msh1552"]
 AVAILABLE_METHODS = ["1d", "3d"]
 
 
+class SharedDataStoreAnalysis(Analysis):
+    """Analysis sharing data stores across targets, cached by their config path"""
+
+    _data_stores = {}
+
+    def _set_data_store(self):
+        # overrides a private Gammapy hook, which re-reads the index files on every call
+        path = make_path(self.config.observations.datastore)
+        if path not in self._data_stores:
+            super()._set_data_store()
+            self._data_stores[path] = self.datastore
+        self.datastore = self._data_stores[path]
+
+
 @click.group()
 @click.option(
     "--log-level", default="INFO", type=click.Choice(["DEBUG", "INFO", "WARNING"])
@@ -34,15 +54,18 @@ def cli(log_level, show_warnings):
 @cli.command("run-analyses", help="Run DL3 analysis validation")
 @click.option("--debug", is_flag=True)
 @click.option("--skip_flux_points", is_flag=True)
+@click.option(
+    "--n-jobs", default=1, help="Number of processes for 3d data reduction and flux points"
+)
 @click.argument("targets", type=click.Choice(list(AVAILABLE_TARGETS) + ["all-targets"]))
 @click.argument("methods", type=click.Choice(list(AVAILABLE_METHODS) + ["all-methods"]))
-def run_analyses(debug, skip_flux_points, targets, methods):
+def run_analyses(debug, skip_flux_points, n_jobs, targets, methods):
     start_time = time.time()
     targets = list(AVAILABLE_TARGETS) if targets == "all-targets" else [targets]
     methods = list(AVAILABLE_METHODS) if methods == "all-methods" else [methods]
 
     with open("targets.yaml", "r") as stream:
-        targets_file = yaml.safe_load(stream)
+        targets_file = yaml.load(stream, Loader=SafeLoader)
 
     for target in targets:
         target_filter = filter(lambda _: _["tag"] == target, targets_file)
@@ -50,7 +73,7 @@ def run_analyses(debug, skip_flux_points, targets, methods):
 
         log.info(f"Processing source: {target}")
         for method in methods:
-            run_analysis(method, target_dict, debug, skip_flux_points)
+            run_analysis(method, target_dict, debug, skip_flux_points, n_jobs)
     end_time = time.time()
     duration = end_time - start_time
     log.info(f"The time taken for the validation is: {duration} s ({duration/60} min)")
@@ -58,18 +81,15 @@ def run_analyses(debug, skip_flux_points, targets, methods):
 
 def write_fit_summary(parameters, outfile):
     """Store fit results with uncertainties"""
-    fit_results_dict = {}
-    for parameter in parameters:
-        value = parameter.value
-        error = parameter.error
-        name = parameter.name
-        fit_results_dict.update({name: value})
-        fit_results_dict.update({name + "_err": float(error)})
-    with open(str(outfile), "w") as f:
-        yaml.dump(fit_results_dict, f)
-
-
-def run_analysis(method, target_dict, debug, skip_flux_points):
+    fit_results_dict = {parameter.name: float(parameter.value) for parameter in parameters}
+    fit_results_dict.update(
+        {parameter.name + "_err": float(parameter.error) for parameter in parameters}
+    )
+    txt = yaml.dump(fit_results_dict, Dumper=SafeDumper, default_flow_style=False)
+    Path(outfile).write_text(txt)
+
+
+def run_analysis(method, target_dict, debug, skip_flux_points, n_jobs=1):
     """If the method is "1d", runs joint spectral analysis for the selected target. If
     instead it is "3d", runs stacked 3D analysis."""
     tag = target_dict["tag"]
@@ -84,13 +104,14 @@ def run_analysis(method, target_dict, debug, skip_flux_points):
     # fixme
     config.datasets.safe_mask.methods = ["edisp-bias", "offset-max"]
     config.datasets.safe_mask.parameters = {"offset_max": "2.5 deg"}
+    config.general.n_jobs = n_jobs
 
     if debug:
         config.observations.obs_ids = [target_dict["debug_run"]]
         config.flux_points.energy.nbins = 1
         if method == "3d":
             config.datasets.geom.axes.energy_true.nbins = 10
-    analysis = Analysis(config)
+    analysis = SharedDataStoreAnalysis(config)
 
     log.info("Running observations selection")
     analysis.get_observations()
@@ -145,9 +166,8 @@ def run_analysis(method, target_dict, debug, skip_flux_points):
         # Freeze all parameters except the backround norm
         if method == "3d":
             dataset = analysis.datasets[0]
-            for parameter in dataset.models.parameters:
-                if parameter is not dataset.background_model.spectral_model.norm:
-                    parameter.frozen = True
+            dataset.models.parameters.freeze_all()
+            dataset.background_model.spectral_model.norm.frozen = False
 
         analysis.fit = Fit(confidence_opts={"backend": "scipy"})
 
@@ -7,6 +7,11 @@ import yaml
 from gammapy.estimators import FluxPoints
 from gammapy.modeling.models import Model
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 log = logging.getLogger(__name__)
 
 
@@ -22,7 +27,7 @@ def main():
         for ndim in [1, 3]:
             # Load the reference and best-fit spectral models
             with open(str(path_ref / f"reference-{ndim}d.yaml")) as file:
-                reference_spectrum_file = yaml.safe_load(file)
+                reference_spectrum_file = yaml.load(file, Loader=SafeLoader)
                 reference_spectrum = Model.create(
                     "PowerLawSpectralModel", model_type="spectral",
                     index=reference_spectrum_file["index"],
@@ -34,7 +39,7 @@ def main():
                 "amplitude_err": reference_spectrum_file["amplitude_err"],
             }
             with open(str(path_res / f"result-{ndim}d.yaml")) as file:
-                result_spectrum_file = yaml.safe_load(file)
+                result_spectrum_file = yaml.load(file, Loader=SafeLoader)
                 result_spectrum = Model.create(
                     "PowerLawSpectralModel", model_type="spectral",
                     index=result_spectrum_file["index"],